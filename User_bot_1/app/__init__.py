@@ -1,9 +1,10 @@
 """Keyword forwarding bot package."""
 
-from .forwarder import KeywordForwarder
+from .forwarder import KeywordForwarder, load_keywords
 from .queue import ForwardingQueue
 
 __all__ = [
     "ForwardingQueue",
     "KeywordForwarder",
+    "load_keywords",
 ]
\ No newline at end of file
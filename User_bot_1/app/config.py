@@ -1,9 +1,34 @@
 """Configuration settings for the bot."""
+import dataclasses
+import hashlib
+import logging
 import os
+import pickle
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
+logger = logging.getLogger(__name__)
+
+# Every environment variable the settings are derived from; the cache key
+# below is a hash over their values, so any change invalidates the cache.
+_CACHE_ENV_VARS = (
+    "TELEGRAM_API_ID",
+    "API_ID",
+    "TELEGRAM_API_HASH",
+    "API_HASH",
+    "TELEGRAM_STRING_SESSION",
+    "SOURCE_CHANNEL",
+    "TARGET_CHANNELS",
+    "FORWARDING_ENABLED",
+    "FORWARDING_DELAY_SECONDS",
+    "FORWARDING_MAX_MESSAGES_PER_SECOND",
+    "FORWARDING_QUEUE_MAXSIZE",
+    "DATA_DIR",
+    "DB_URL",
+    "LOG_LEVEL",
+)
+
 
 def _to_bool(value: str | None, default: bool) -> bool:
     """Return a boolean from an environment value."""
@@ -37,7 +62,44 @@ def _sqlite_path_from_url(url: str | None, fallback: Path) -> Path:
     return Path(url)
 
 
-@dataclass
+def _split_channels(value: str | None) -> List[str]:
+    """Split a comma-separated channel list."""
+
+    if not value:
+        return []
+    return [ch.strip() for ch in value.split(",") if ch.strip()]
+
+
+# One (attribute, env names, converter) row per setting; from_env walks
+# this table in a single pass instead of hand-written os.getenv chains.
+_ENV_SPEC = (
+    ("api_id", ("TELEGRAM_API_ID", "API_ID"), lambda raw: int(raw or "0")),
+    ("api_hash", ("TELEGRAM_API_HASH", "API_HASH"), lambda raw: raw or ""),
+    ("string_session", ("TELEGRAM_STRING_SESSION",), lambda raw: (raw or "").strip()),
+    ("source_channel", ("SOURCE_CHANNEL",), lambda raw: raw or ""),
+    ("target_channels", ("TARGET_CHANNELS",), _split_channels),
+    ("forwarding_enabled", ("FORWARDING_ENABLED",), lambda raw: _to_bool(raw, True)),
+    (
+        "forwarding_delay_seconds",
+        ("FORWARDING_DELAY_SECONDS",),
+        lambda raw: _to_float(raw, 0.0) or 0.0,
+    ),
+    (
+        "forwarding_max_messages_per_second",
+        ("FORWARDING_MAX_MESSAGES_PER_SECOND",),
+        lambda raw: _to_float(raw, None),
+    ),
+    (
+        "forwarding_queue_maxsize",
+        ("FORWARDING_QUEUE_MAXSIZE",),
+        lambda raw: int(raw) if raw else 10000,
+    ),
+    ("data_dir", ("DATA_DIR",), lambda raw: Path(raw or "data")),
+    ("log_level", ("LOG_LEVEL",), lambda raw: raw or "INFO"),
+)
+
+
+@dataclass(slots=True)
 class Settings:
     """Bot configuration settings."""
 
@@ -54,42 +116,91 @@ class Settings:
     db_path: Path
     log_level: str
 
-    def __init__(self):
-        """Initialize settings from environment variables."""
-
-        self.api_id = int(os.getenv("TELEGRAM_API_ID", os.getenv("API_ID", "0")))
-        self.api_hash = os.getenv("TELEGRAM_API_HASH", os.getenv("API_HASH", ""))
-        self.string_session = os.getenv("TELEGRAM_STRING_SESSION", "").strip()
-
-        self.source_channel = os.getenv("SOURCE_CHANNEL", "")
-        target_channels_str = os.getenv("TARGET_CHANNELS", "")
-        self.target_channels = [
-            ch.strip() for ch in target_channels_str.split(",") if ch.strip()
-        ]
-
-        self.forwarding_enabled = _to_bool(
-            os.getenv("FORWARDING_ENABLED"), True
-        )
-        self.forwarding_delay_seconds = _to_float(
-            os.getenv("FORWARDING_DELAY_SECONDS"), 0.0
-        ) or 0.0
-        self.forwarding_max_messages_per_second = _to_float(
-            os.getenv("FORWARDING_MAX_MESSAGES_PER_SECOND"), None
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from environment variables."""
+
+        values = {}
+        for attr, names, convert in _ENV_SPEC:
+            raw = None
+            for name in names:
+                raw = os.getenv(name)
+                if raw is not None:
+                    break
+            values[attr] = convert(raw)
+
+        values["db_path"] = _sqlite_path_from_url(
+            os.getenv("DB_URL"), values["data_dir"] / "db.sqlite3"
         )
-        queue_maxsize = os.getenv("FORWARDING_QUEUE_MAXSIZE", "")
-        self.forwarding_queue_maxsize = int(queue_maxsize) if queue_maxsize else None
+        settings = cls(**values)
 
-        self.data_dir = Path(os.getenv("DATA_DIR", "data"))
-        self.db_path = _sqlite_path_from_url(
-            os.getenv("DB_URL"), self.data_dir / "db.sqlite3"
-        )
-        self.log_level = os.getenv("LOG_LEVEL", "INFO")
-
-        if not self.api_id or not self.api_hash:
+        if not settings.api_id or not settings.api_hash:
             raise ValueError("TELEGRAM_API_ID and TELEGRAM_API_HASH must be set")
-        if not self.string_session:
+        if not settings.string_session:
             raise ValueError("TELEGRAM_STRING_SESSION must be set")
-        if not self.source_channel:
+        if not settings.source_channel:
             raise ValueError("SOURCE_CHANNEL must be set")
-        if not self.target_channels and self.forwarding_enabled:
+        if not settings.target_channels and settings.forwarding_enabled:
             raise ValueError("TARGET_CHANNELS must be set when forwarding is enabled")
+
+        return settings
+
+
+def _settings_cache_file() -> Path:
+    """Return the cache file path for the current environment.
+
+    The key hashes the Settings field names alongside the env values:
+    a pickle from an older class layout unpickles cleanly but lacks any
+    later-added slots, so a schema change must land in a different file
+    rather than resurface as AttributeError on every restart.
+    """
+
+    schema = ",".join(f.name for f in dataclasses.fields(Settings))
+    key = hashlib.blake2b(
+        "|".join(
+            [schema, *(os.getenv(name, "") for name in _CACHE_ENV_VARS)]
+        ).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    cache_root = Path(
+        os.getenv("XDG_CACHE_HOME", str(Path.home() / ".cache"))
+    )
+    return cache_root / "user_bot_last" / f"settings-{key}.pkl"
+
+
+def load_settings() -> Settings:
+    """Load settings, reusing a cached copy for an unchanged environment.
+
+    Supervisors that restart the bot on failure re-run the full env
+    parsing each time; the resolved Settings are pickled keyed by a hash
+    of the relevant variables, so restarts with the same environment
+    skip the parsing and validation work entirely.
+    """
+
+    cache_file = _settings_cache_file()
+    try:
+        with open(cache_file, "rb") as fh:
+            cached = pickle.load(fh)
+        if isinstance(cached, Settings):
+            return cached
+    except Exception:
+        # A missing or unreadable cache just means we re-parse the
+        # environment; layout changes never reach here because the
+        # schema is part of the cache key.
+        pass
+
+    settings = Settings.from_env()
+    try:
+        # The pickle carries api_hash and the string session — the same
+        # credentials create_session.py is careful not to echo — so the
+        # cache is owner-only; chmod also tightens files and directories
+        # left behind by earlier versions.
+        cache_file.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        os.chmod(cache_file.parent, 0o700)
+        fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(settings, fh)
+        os.chmod(cache_file, 0o600)
+    except OSError as exc:  # pragma: no cover - defensive
+        logger.debug("Could not write settings cache: %s", exc)
+    return settings
@@ -1,14 +1,128 @@
 """Deduplication store for tracking processed messages."""
+import asyncio
 import hashlib
 import logging
+import math
+import queue
 import sqlite3
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 logger = logging.getLogger(__name__)
 
 
+_UINT64_MASK = (1 << 64) - 1
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over 64-bit message hash keys.
+
+    A negative answer is definitive, so the common "never seen this"
+    case never has to touch SQLite; positives are confirmed against the
+    database to rule out false positives.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-4):
+        num_bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._num_bits = max(num_bits, 64)
+        self._num_hashes = max(1, round(self._num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+
+    def _positions(self, key: int):
+        # Double hashing: the key itself and a cheap multiplicative mix
+        # of it, so no extra hash computation beyond the dedup key.
+        h1 = key & _UINT64_MASK
+        h2 = ((h1 * 0x9E3779B97F4A7C15) & _UINT64_MASK) | 1
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % self._num_bits
+
+    def add(self, key: int) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: int) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key)
+        )
+
+
+class _WriteBatcher(threading.Thread):
+    """Background writer that batches fire-and-forget statements.
+
+    Every synchronous commit is a WAL append and an eventual fsync.
+    Writes whose result nobody waits on — a processed key, a joined
+    channel, a pending forward — are funnelled through this thread and
+    flushed in one transaction every ~50 ms or 200 statements, whichever
+    comes first.  The durability window is that flush interval: an
+    unclean exit can lose at most the last batch, which for this data
+    means a message might be forwarded twice after a crash.
+    """
+
+    _FLUSH_INTERVAL = 0.05
+    _MAX_BATCH = 200
+
+    def __init__(self, store: "DeduplicationStore"):
+        super().__init__(name="dedup-writer", daemon=True)
+        self._store = store
+        self._items: queue.Queue = queue.Queue()
+
+    def submit(self, sql: str, params: tuple, key: int | None = None) -> None:
+        """Enqueue a statement; key marks a dedup-hash insert in flight."""
+
+        self._items.put((sql, params, key))
+
+    def run(self):
+        while True:
+            item = self._items.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self._FLUSH_INTERVAL
+            stopping = False
+            while len(batch) < self._MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._items.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._flush(batch)
+            if stopping:
+                break
+
+    def _flush(self, batch: list) -> None:
+        store = self._store
+        with store._lock:
+            try:
+                for sql, params, _ in batch:
+                    store._conn.execute(sql, params)
+                store._conn.commit()
+                for _, _, key in batch:
+                    if key is not None:
+                        store._pending_keys.discard(key)
+            except Exception as exc:  # pragma: no cover - defensive
+                # Roll back so the statements that did execute cannot be
+                # committed later by an unrelated writer on the shared
+                # connection.  Keys stay in _pending_keys, so lookups
+                # keep treating them as seen rather than re-forwarding.
+                store._conn.rollback()
+                logger.error("Error flushing batched dedup writes: %s", exc)
+
+    def close(self) -> None:
+        """Flush outstanding writes and stop the thread."""
+
+        self._items.put(None)
+        self.join(timeout=5.0)
+
+
 class DeduplicationStore:
     """Store for tracking processed messages to avoid duplicates."""
 
@@ -24,29 +138,177 @@ class DeduplicationStore:
         self.retention_days = retention_days
 
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        # One long-lived connection instead of a connect/close pair per call.
+        # check_same_thread=False because callers may reach us from worker
+        # threads; the lock below serialises all access to the connection.
+        self._lock = threading.Lock()
+        # Hash keys handed to the background writer but not yet flushed;
+        # lookups treat them as already stored.  Guarded by _lock.
+        self._pending_keys: set = set()
+        # cached_statements keeps prepared statements around so hot-path
+        # SQL is parsed and planned only once per distinct statement.
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=256
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._cursor = self._conn.cursor()
+
+        # Per-connection tuning: WAL + synchronous=NORMAL turns the fsync
+        # per commit into a cheap WAL append, and the cache/mmap settings
+        # keep hot index pages in memory.  Must run before any writes.
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA mmap_size=268435456;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            """
+        )
+
         self._init_db()
         self._cleanup_old_entries()
 
+        self._bloom = _BloomFilter()
+        self._load_bloom()
+
+        self._writer = _WriteBatcher(self)
+        self._writer.start()
+
         logger.info("Initialized deduplication store at %s", db_path)
 
-    def _init_db(self):
-        """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS processed_messages (
-                    message_hash TEXT PRIMARY KEY,
-                    processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    # Daily partition helpers.  Hashes live in one table per day
+    # (processed_messages_YYYYMMDD) so retention cleanup is a DROP TABLE
+    # instead of a row-wise DELETE that churns the B-tree and the WAL.
+    _DAY_TABLE_PREFIX = "processed_messages_"
+
+    @classmethod
+    def _day_table_name(cls, timestamp: float) -> str:
+        return cls._DAY_TABLE_PREFIX + time.strftime(
+            "%Y%m%d", time.localtime(timestamp)
+        )
+
+    def _discover_hash_tables_locked(self) -> None:
+        """Find existing day partitions (and any legacy flat table)."""
+
+        self._day_tables: set = set()
+        self._has_legacy_table = False
+        for (name,) in self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'processed_messages%'"
+        ):
+            if name == "processed_messages":
+                self._has_legacy_table = True
+            elif name.startswith(self._DAY_TABLE_PREFIX) and name[
+                len(self._DAY_TABLE_PREFIX):
+            ].isdigit():
+                self._day_tables.add(name)
+
+    def _hash_tables_locked(self) -> list:
+        """Tables to consult for hash lookups, oldest first."""
+
+        tables = sorted(self._day_tables)
+        if self._has_legacy_table:
+            tables.append("processed_messages")
+        return tables
+
+    def _ensure_today_table_locked(self) -> str:
+        """Create today's partition lazily and return its name."""
+
+        name = self._day_table_name(time.time())
+        if name not in self._day_tables:
+            # Integer unix seconds pack tighter than ISO timestamp strings
+            # and compare as plain integers.
+            self._conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {name} (
+                    message_hash INTEGER PRIMARY KEY,
+                    processed_at INTEGER NOT NULL DEFAULT (strftime('%s', 'now'))
                 )
                 """
             )
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_processed_at
-                ON processed_messages(processed_at)
-                """
+            self._conn.commit()
+            self._day_tables.add(name)
+        return name
+
+    def _migrate_blob_keys_locked(self) -> None:
+        """Rewrite pre-int64 BLOB keys in existing partitions in place.
+
+        The int64 key is the first 8 bytes of the digest that used to be
+        stored whole, so old rows convert losslessly.
+        """
+
+        for table in sorted(self._day_tables):
+            rows = self._conn.execute(
+                f"SELECT message_hash FROM {table} WHERE typeof(message_hash) = 'blob'"
+            ).fetchall()
+            if not rows:
+                continue
+            self._conn.executemany(
+                f"UPDATE OR IGNORE {table} SET message_hash = ? WHERE message_hash = ?",
+                [
+                    (int.from_bytes(row[0][:8], "little", signed=True), row[0])
+                    for row in rows
+                ],
             )
-            conn.execute(
+            # Anything still BLOB collided with an existing int key.
+            self._conn.execute(
+                f"DELETE FROM {table} WHERE typeof(message_hash) = 'blob'"
+            )
+            logger.info("Migrated %s dedup keys in %s to int64", len(rows), table)
+        self._conn.commit()
+
+    def _migrate_joined_channels_locked(self) -> None:
+        """Rebuild a pre-WITHOUT-ROWID joined_channels table in place.
+
+        With a TEXT primary key, a rowid table stores every link twice
+        (index entry plus row) and each lookup descends two B-trees;
+        WITHOUT ROWID clusters the row under the key itself.  The table
+        is capped by the join limit, so the rebuild is a few hundred
+        rows at most.
+        """
+
+        row = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'joined_channels'"
+        ).fetchone()
+        if row is None or "WITHOUT ROWID" in row["sql"]:
+            return
+        self._conn.executescript(
+            """
+            ALTER TABLE joined_channels RENAME TO joined_channels_rowid;
+            CREATE TABLE joined_channels (
+                channel_link TEXT PRIMARY KEY,
+                channel_id INTEGER,
+                joined_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+            ) WITHOUT ROWID;
+            INSERT INTO joined_channels
+                SELECT channel_link, channel_id, joined_at
+                FROM joined_channels_rowid;
+            DROP TABLE joined_channels_rowid;
+            """
+        )
+        logger.info("Rebuilt joined_channels as WITHOUT ROWID")
+
+    def _contains_locked(self, message_hash: int) -> bool:
+        """Probe every live partition for the given hash."""
+
+        if message_hash in self._pending_keys:
+            return True
+        tables = self._hash_tables_locked()
+        if not tables:
+            return False
+        sql = " UNION ALL ".join(
+            f"SELECT 1 FROM {table} WHERE message_hash = ?" for table in tables
+        )
+        self._cursor.execute(sql, (message_hash,) * len(tables))
+        return self._cursor.fetchone() is not None
+
+    def _init_db(self):
+        """Initialize database schema."""
+        with self._lock:
+            self._discover_hash_tables_locked()
+            self._migrate_blob_keys_locked()
+            self._conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS pending_forwards (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -60,37 +322,97 @@ class DeduplicationStore:
                 )
                 """
             )
-            conn.execute(
+            self._conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS joined_channels (
                     channel_link TEXT PRIMARY KEY,
                     channel_id INTEGER,
                     joined_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
-                )
+                ) WITHOUT ROWID
+                """
+            )
+            self._migrate_joined_channels_locked()
+            # get_oldest_joined_channel runs ORDER BY joined_at LIMIT 1
+            # on every join-limit eviction; without this index that is a
+            # full scan of the table.
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_joined_channels_joined_at
+                ON joined_channels(joined_at)
                 """
             )
 
-            conn.commit()
+            self._conn.commit()
 
     def _cleanup_old_entries(self):
-        """Remove entries older than retention period."""
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "DELETE FROM processed_messages WHERE processed_at < ?",
-                (cutoff_date,),
-            )
-            deleted_count = cursor.rowcount
-            conn.commit()
-            if deleted_count > 0:
-                logger.info("Cleaned up %s old entries", deleted_count)
-
-    def _hash_message(self, message_text: str) -> str:
-        """Create hash of message text."""
+        """Drop partitions (and legacy rows) older than the retention period."""
+        cutoff_ts = int(time.time()) - self.retention_days * 86400
+        cutoff_name = self._day_table_name(cutoff_ts)
+        dropped = 0
+        deleted_count = 0
+        with self._lock:
+            for name in sorted(self._day_tables):
+                if name < cutoff_name:
+                    self._conn.execute(f"DROP TABLE IF EXISTS {name}")
+                    self._day_tables.discard(name)
+                    dropped += 1
+            if self._has_legacy_table:
+                # Legacy rows carry ISO timestamp strings, so keep binding
+                # a datetime for them until the table drains.
+                cursor = self._conn.execute(
+                    "DELETE FROM processed_messages WHERE processed_at < ?",
+                    (datetime.fromtimestamp(cutoff_ts),),
+                )
+                deleted_count = cursor.rowcount
+                if (
+                    self._conn.execute(
+                        "SELECT 1 FROM processed_messages LIMIT 1"
+                    ).fetchone()
+                    is None
+                ):
+                    self._conn.execute("DROP TABLE processed_messages")
+                    self._has_legacy_table = False
+            self._conn.commit()
+        if dropped:
+            logger.info("Dropped %s expired dedup partitions", dropped)
+        if deleted_count > 0:
+            logger.info("Cleaned up %s old entries", deleted_count)
+
+    def _load_bloom(self):
+        """Seed the Bloom filter with the hashes already on disk."""
+
+        loaded = 0
+        with self._lock:
+            for table in self._hash_tables_locked():
+                for (message_hash,) in self._conn.execute(
+                    f"SELECT message_hash FROM {table}"
+                ):
+                    if not isinstance(message_hash, int):
+                        # Pre-int64 legacy rows use a different hash format
+                        # and can never match a current probe; skip them.
+                        continue
+                    self._bloom.add(message_hash)
+                    loaded += 1
+        if loaded:
+            logger.info("Seeded bloom filter with %s known hashes", loaded)
+
+    def _hash_message(self, message_text: str | bytes) -> int:
+        """Create the 64-bit hash key for a message text.
+
+        Callers that already hold UTF-8 bytes can pass them directly and
+        skip a second encode of the same payload.
+        """
 
-        return hashlib.sha256(message_text.encode("utf-8")).hexdigest()
+        # The first 8 bytes of the blake2b digest, as a signed int64.  An
+        # INTEGER PRIMARY KEY aliases SQLite's rowid, so lookups cost one
+        # B-tree descent instead of two, and the key needs no separate
+        # index.  ~2^-32 collision odds per pair are fine for dedup.
+        if isinstance(message_text, str):
+            message_text = message_text.encode("utf-8")
+        digest = hashlib.blake2b(message_text, digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little", signed=True)
 
-    def is_duplicate(self, message_text: str) -> bool:
+    def is_duplicate(self, message_text: str | bytes) -> bool:
         """
         Check if message has been processed before.
 
@@ -100,16 +422,50 @@ class DeduplicationStore:
         Returns:
             True if message is a duplicate, False otherwise
         """
+        return self.is_duplicate_key(self._hash_message(message_text))
+
+    def is_duplicate_key(self, key: int) -> bool:
+        """Check a pre-computed 64-bit identity key without hashing."""
+
+        if key not in self._bloom:
+            return False
+
+        with self._lock:
+            return self._contains_locked(key)
+
+    def check_and_add(self, message_text: str | bytes) -> bool:
+        """
+        Atomically record a message, reporting whether it was new.
+
+        Args:
+            message_text: Message text to record
+
+        Returns:
+            True if the message was not seen before, False if it is a
+            duplicate
+        """
         message_hash = self._hash_message(message_text)
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT 1 FROM processed_messages WHERE message_hash = ?",
+        with self._lock:
+            if self._contains_locked(message_hash):
+                return False
+            table = self._ensure_today_table_locked()
+            self._cursor.execute(
+                f"""
+                INSERT OR IGNORE INTO {table} (message_hash)
+                VALUES (?) RETURNING 1
+                """,
                 (message_hash,),
             )
-            return cursor.fetchone() is not None
-
-    def add_message(self, message_text: str) -> bool:
+            inserted = self._cursor.fetchone() is not None
+            self._conn.commit()
+            # Bloom updates stay under the lock: the bit |= on the shared
+            # bytearray is not atomic, and a lost bit here would turn
+            # into a definitive false negative later.
+            self._bloom.add(message_hash)
+        return inserted
+
+    def add_message(self, message_text: str | bytes) -> bool:
         """
         Add message to processed list.
 
@@ -119,45 +475,160 @@ class DeduplicationStore:
         Returns:
             True if added successfully, False otherwise
         """
-        message_hash = self._hash_message(message_text)
+        return self.add_key(self._hash_message(message_text))
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "INSERT OR IGNORE INTO processed_messages (message_hash) VALUES (?)",
-                (message_hash,),
+    def add_key(self, key: int) -> bool:
+        """Record a pre-computed 64-bit identity key.
+
+        The insert goes through the background writer; the key is
+        visible to lookups immediately via _pending_keys.
+
+        Returns:
+            True once the key is recorded (whether or not it was new)
+        """
+
+        with self._lock:
+            if self._contains_locked(key):
+                return True
+            table = self._ensure_today_table_locked()
+            self._pending_keys.add(key)
+            self._bloom.add(key)
+        self._writer.submit(
+            f"INSERT OR IGNORE INTO {table} (message_hash) VALUES (?)",
+            (key,),
+            key=key,
+        )
+        return True
+
+    def delete_message(self, message_text: str | bytes) -> None:
+        """Un-record a message so a later repost can be retried.
+
+        Needed when a link was committed by check_and_add but the
+        follow-up work (enqueue, fetch, forward) failed: leaving the key
+        behind would suppress every repost for the retention window.
+        """
+
+        self.delete_key(self._hash_message(message_text))
+
+    def delete_key(self, key: int) -> None:
+        """Remove a recorded 64-bit key from every live partition."""
+
+        with self._lock:
+            self._pending_keys.discard(key)
+            for table in self._hash_tables_locked():
+                self._conn.execute(
+                    f"DELETE FROM {table} WHERE message_hash = ?", (key,)
+                )
+            self._conn.commit()
+        # The bloom filter cannot forget a key; its stale positive only
+        # costs the SQL probe, which now reports the key as absent.
+
+    def filter_new(self, message_texts: Iterable[str | bytes]) -> List:
+        """Return the subset of texts not yet recorded, in input order.
+
+        One IN (...) probe per partition replaces a round-trip per
+        text; keys the bloom filter rejects skip SQL entirely, and
+        parameter lists are chunked under SQLite's 999-variable limit.
+
+        Args:
+            message_texts: Message texts (or UTF-8 bytes) to test
+
+        Returns:
+            The texts whose keys are absent from the store
+        """
+
+        pairs = [(text, self._hash_message(text)) for text in message_texts]
+        maybe_seen = [key for _, key in pairs if key in self._bloom]
+        seen: set = set()
+        if maybe_seen:
+            with self._lock:
+                seen.update(key for key in maybe_seen if key in self._pending_keys)
+                tables = self._hash_tables_locked()
+                for start in range(0, len(maybe_seen), 999):
+                    chunk = maybe_seen[start:start + 999]
+                    placeholders = ",".join("?" * len(chunk))
+                    for table in tables:
+                        self._cursor.execute(
+                            f"SELECT message_hash FROM {table} "
+                            f"WHERE message_hash IN ({placeholders})",
+                            chunk,
+                        )
+                        seen.update(row[0] for row in self._cursor.fetchall())
+        return [text for text, key in pairs if key not in seen]
+
+    def add_messages(self, message_texts: Iterable[str | bytes]) -> None:
+        """Record many messages with one executemany and one commit.
+
+        Args:
+            message_texts: Message texts (or UTF-8 bytes) to record
+        """
+
+        keys = [self._hash_message(text) for text in message_texts]
+        if not keys:
+            return
+        with self._lock:
+            table = self._ensure_today_table_locked()
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO {table} (message_hash) VALUES (?)",
+                [(key,) for key in keys],
             )
-            conn.commit()
-            return True
+            self._conn.commit()
+            for key in keys:
+                self._bloom.add(key)
 
     def get_stats(self) -> dict:
         """Get statistics about stored messages."""
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT COUNT(*) as total FROM processed_messages"
-            )
-            total = cursor.fetchone()[0]
-
-            cursor = conn.execute(
-                """
-                SELECT COUNT(*) as today
-                FROM processed_messages
-                WHERE DATE(processed_at) = DATE('now')
-                """
-            )
-            today = cursor.fetchone()[0]
+        with self._lock:
+            total = 0
+            for table in self._hash_tables_locked():
+                total += self._conn.execute(
+                    f"SELECT COUNT(*) FROM {table}"
+                ).fetchone()[0]
+
+            today = 0
+            today_table = self._day_table_name(time.time())
+            if today_table in self._day_tables:
+                today = self._conn.execute(
+                    f"SELECT COUNT(*) FROM {today_table}"
+                ).fetchone()[0]
+            if self._has_legacy_table:
+                today += self._conn.execute(
+                    """
+                    SELECT COUNT(*)
+                    FROM processed_messages
+                    WHERE DATE(processed_at) = DATE('now')
+                    """
+                ).fetchone()[0]
+
+        return {
+            "total_messages": total,
+            "messages_today": today,
+            "retention_days": self.retention_days,
+        }
+
+    async def run_cleanup_loop(self, interval_seconds: float = 3600.0):
+        """Periodically expire old partitions without blocking shutdown.
+
+        Retention used to be enforced from close(), delaying process exit
+        and risking a SIGTERM mid-delete.  Run this as a background task
+        instead; with day partitions each pass is a cheap table drop.
+        """
 
-            return {
-                "total_messages": total,
-                "messages_today": today,
-                "retention_days": self.retention_days,
-            }
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await asyncio.to_thread(self._cleanup_old_entries)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.error("Error during background cleanup: %s", exc)
 
     def close(self):
-        """Close database connection and cleanup."""
+        """Flush pending writes and close the database connection."""
 
         try:
-            self._cleanup_old_entries()
+            self._writer.close()
+            with self._lock:
+                self._conn.close()
             logger.info("Deduplication store closed")
         except Exception as e:  # pragma: no cover - defensive
             logger.error("Error closing deduplication store: %s", e)
@@ -170,18 +641,38 @@ class DeduplicationStore:
         status: str,
         error_text: str | None = None,
     ) -> None:
-        """Insert a pending forward task."""
+        """Insert a pending forward task.
+
+        Fire-and-forget: the retry worker only reads this table minutes
+        later, so the write goes through the background batcher.
+        """
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        self._writer.submit(
+            """
+            INSERT INTO pending_forwards
+            (message_link, channel_link, status, error_text)
+            VALUES (?, ?, ?, ?)
+            """,
+            (message_link, channel_link, status, error_text),
+        )
+
+    def add_pending_forwards_bulk(self, rows: Iterable[tuple]) -> None:
+        """Insert many pending forward tasks in one transaction.
+
+        Args:
+            rows: Iterable of (message_link, channel_link, status, error_text)
+        """
+
+        with self._lock:
+            self._conn.executemany(
                 """
                 INSERT INTO pending_forwards
                 (message_link, channel_link, status, error_text)
                 VALUES (?, ?, ?, ?)
                 """,
-                (message_link, channel_link, status, error_text),
+                rows,
             )
-            conn.commit()
+            self._conn.commit()
 
     def update_pending_forward_status(
         self,
@@ -193,8 +684,8 @@ class DeduplicationStore:
     ) -> None:
         """Update status and attempt counters for a pending forward."""
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._lock:
+            self._conn.execute(
                 """
                 UPDATE pending_forwards
                 SET status = ?, attempts = ?, last_try_at = ?, error_text = ?
@@ -202,16 +693,33 @@ class DeduplicationStore:
                 """,
                 (status, attempts, last_try_at, error_text, row_id),
             )
-            conn.commit()
+            self._conn.commit()
+
+    def update_pending_forward_statuses_bulk(self, rows: Iterable[tuple]) -> None:
+        """Update many pending forward rows in one transaction.
+
+        Args:
+            rows: Iterable of (status, attempts, last_try_at, error_text, row_id)
+        """
+
+        with self._lock:
+            self._conn.executemany(
+                """
+                UPDATE pending_forwards
+                SET status = ?, attempts = ?, last_try_at = ?, error_text = ?
+                WHERE id = ?
+                """,
+                rows,
+            )
+            self._conn.commit()
 
     def get_pending_forwards_for_retry(
         self, limit: int = 20, max_attempts: int = 20
     ) -> List[sqlite3.Row]:
         """Fetch pending forwards awaiting approval."""
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
+        with self._lock:
+            cursor = self._conn.execute(
                 """
                 SELECT id, message_link, channel_link, status, attempts, created_at, last_try_at
                 FROM pending_forwards
@@ -225,33 +733,56 @@ class DeduplicationStore:
 
     # Channel join tracking
     def record_joined_channel(self, channel_link: str, channel_id: int | None) -> None:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        # Proper UPSERT: INSERT OR REPLACE would delete and re-insert the
+        # row, churning the B-tree; DO UPDATE edits it in place.  Nobody
+        # reads the row back immediately, so it rides the batched writer.
+        self._writer.submit(
+            """
+            INSERT INTO joined_channels (channel_link, channel_id, joined_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(channel_link) DO UPDATE SET
+                channel_id = excluded.channel_id,
+                joined_at = CURRENT_TIMESTAMP
+            """,
+            (channel_link, channel_id),
+        )
+
+    def record_joined_channels_bulk(self, rows: Iterable[tuple]) -> None:
+        """Record many joined channels with a single commit.
+
+        Args:
+            rows: Iterable of (channel_link, channel_id)
+        """
+
+        with self._lock:
+            self._conn.executemany(
                 """
-                INSERT OR REPLACE INTO joined_channels (channel_link, channel_id, joined_at)
+                INSERT INTO joined_channels (channel_link, channel_id, joined_at)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(channel_link) DO UPDATE SET
+                    channel_id = excluded.channel_id,
+                    joined_at = CURRENT_TIMESTAMP
                 """,
-                (channel_link, channel_id),
+                rows,
             )
-            conn.commit()
+            self._conn.commit()
 
     def remove_joined_channel(self, channel_link: str) -> None:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._lock:
+            self._conn.execute(
                 "DELETE FROM joined_channels WHERE channel_link = ?",
                 (channel_link,),
             )
-            conn.commit()
+            self._conn.commit()
 
     def count_joined_channels(self) -> int:
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM joined_channels")
+        with self._lock:
+            cursor = self._conn.execute("SELECT COUNT(*) FROM joined_channels")
             return int(cursor.fetchone()[0])
 
     def get_oldest_joined_channel(self) -> Optional[sqlite3.Row]:
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
+        with self._lock:
+            cursor = self._conn.execute(
                 """
                 SELECT channel_link, channel_id, joined_at
                 FROM joined_channels
@@ -260,4 +791,3 @@ class DeduplicationStore:
                 """
             )
             return cursor.fetchone()
-
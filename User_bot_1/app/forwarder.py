@@ -1,9 +1,62 @@
 """Keyword matching and message forwarding logic."""
 import logging
 import re
+from pathlib import Path
+
+try:  # Optional fast path; falls back to per-pattern regex scans.
+    import ahocorasick
+except ImportError:  # pragma: no cover - depends on environment
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+_WORD_CHARS = re.compile(r"\w")
+
+
+def _is_word_boundary(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] is not embedded in a longer word."""
+
+    if start > 0 and _WORD_CHARS.match(text[start - 1]):
+        return False
+    if end < len(text) and _WORD_CHARS.match(text[end]):
+        return False
+    return True
+
+
+def load_keywords(file_path: str | Path = "keywords.txt") -> tuple:
+    """Load keywords from a file, skipping blank lines.
+
+    Every non-blank line is a keyword — hashtags like "#розыгрыш" are
+    real entries, so there is no comment syntax.  Returns an immutable
+    tuple so the list is built exactly once; logging shows the count
+    and a truncated sample rather than formatting the whole list.
+
+    Args:
+        file_path: Path to the keywords file, one keyword per line
+
+    Returns:
+        Tuple of keywords in file order
+    """
+
+    # One read syscall and one C-level split instead of iterating the
+    # file object line by line through the io layer.
+    try:
+        lines = Path(file_path).read_text(encoding="utf-8").splitlines()
+    except OSError as exc:
+        logger.warning("Could not read keywords file %s: %s", file_path, exc)
+        return ()
+
+    result = tuple(
+        stripped for stripped in (line.strip() for line in lines) if stripped
+    )
+    logger.info(
+        "Loaded %d keywords from %s (first 20: %s)",
+        len(result),
+        file_path,
+        result[:20],
+    )
+    return result
+
 
 class KeywordForwarder:
     """Handles keyword matching and message forwarding."""
@@ -26,19 +79,71 @@ class KeywordForwarder:
         self.case_sensitive = case_sensitive
         self.forwarding_enabled = forwarding_enabled
 
-        # Compile regex patterns for each keyword
+        # One Aho-Corasick automaton scans the text in a single linear
+        # pass regardless of how many keywords there are.
+        self.automaton = None
+        if ahocorasick is not None and keywords:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                needle = keyword if case_sensitive else keyword.lower()
+                self.automaton.add_word(needle, keyword)
+            self.automaton.make_automaton()
+
+        # Compile regex patterns for each keyword (fallback matcher).
+        # Keywords are pre-lowered instead of using re.IGNORECASE so the
+        # engine never case-folds the haystack; the hot methods lower the
+        # text once per message instead.  No \b in the patterns: for
+        # needles with non-word edge characters ("#розыгрыш") \b inverts
+        # its meaning, so both matcher paths check occurrences against
+        # _is_word_boundary instead and agree regardless of whether
+        # pyahocorasick is installed.
         self.patterns = []
+        needles = []
         for keyword in keywords:
-            # Escape special regex characters
-            escaped = re.escape(keyword)
-            # Create word boundary pattern
-            pattern = rf"\b{escaped}\b"
-            flags = 0 if case_sensitive else re.IGNORECASE
-            self.patterns.append(re.compile(pattern, flags))
+            needle = keyword if case_sensitive else keyword.lower()
+            needles.append(needle)
+            self.patterns.append(re.compile(re.escape(needle)))
+
+        # Single fused alternation used as a quick rejection filter: if
+        # no needle occurs anywhere, the per-keyword boundary scan is
+        # skipped entirely.
+        self._any_pattern = (
+            re.compile("|".join(re.escape(n) for n in needles))
+            if needles
+            else None
+        )
+
+        # O(1) whole-word membership for callers that already have a
+        # normalized token in hand.
+        self.keyword_set = frozenset(needles)
 
         logger.info(
             f"Initialized forwarder with {len(keywords)} keywords "
-            f"(case_sensitive={case_sensitive}, forwarding_enabled={forwarding_enabled})"
+            f"(case_sensitive={case_sensitive}, forwarding_enabled={forwarding_enabled}, "
+            f"aho_corasick={self.automaton is not None})"
+        )
+
+    def _normalize(self, text: str) -> str:
+        """Lowercase the text once per message when matching insensitively."""
+
+        return text if self.case_sensitive else text.lower()
+
+    def _iter_automaton_hits(self, haystack: str):
+        """Yield automaton keyword hits that fall on word boundaries."""
+
+        for end_index, keyword in self.automaton.iter(haystack):
+            end = end_index + 1
+            start = end - len(keyword)
+            if _is_word_boundary(haystack, start, end):
+                yield keyword
+
+    @staticmethod
+    def _pattern_hits(haystack: str, pattern) -> bool:
+        """Check whether any occurrence falls on word boundaries."""
+
+        return any(
+            _is_word_boundary(haystack, match.start(), match.end())
+            for match in pattern.finditer(haystack)
         )
 
     def contains_keywords(self, text: str) -> bool:
@@ -54,11 +159,34 @@ class KeywordForwarder:
         if not text:
             return False
 
-        for pattern in self.patterns:
-            if pattern.search(text):
-                return True
+        return self.contains_keywords_normalized(self._normalize(text))
 
-        return False
+    def contains_keywords_normalized(self, haystack: str) -> bool:
+        """Check an already-normalized haystack against the keywords.
+
+        Callers that run several checks on the same message can lower
+        the text once and reuse it instead of paying a case-folding
+        pass per call.
+
+        Args:
+            haystack: Text already lowered via _normalize (or verbatim
+                when matching case-sensitively)
+
+        Returns:
+            True if any keyword is found, False otherwise
+        """
+        if not haystack:
+            return False
+
+        if self.automaton is not None:
+            return next(self._iter_automaton_hits(haystack), None) is not None
+
+        if self._any_pattern is None or self._any_pattern.search(haystack) is None:
+            return False
+
+        return any(
+            self._pattern_hits(haystack, pattern) for pattern in self.patterns
+        )
 
     def get_matched_keywords(self, text: str) -> list[str]:
         """
@@ -73,9 +201,14 @@ class KeywordForwarder:
         if not text:
             return []
 
+        haystack = self._normalize(text)
+
+        if self.automaton is not None:
+            return list(dict.fromkeys(self._iter_automaton_hits(haystack)))
+
         matched = []
         for keyword, pattern in zip(self.keywords, self.patterns):
-            if pattern.search(text):
+            if self._pattern_hits(haystack, pattern):
                 matched.append(keyword)
 
-        return matched
\ No newline at end of file
+        return matched
@@ -13,12 +13,22 @@ from telethon.errors.rpcerrorlist import (
     PeerIdInvalidError,
 )
 
-from telethon.tl.types import Message
+from telethon.tl.types import Message, PeerChannel, PeerChat, PeerUser
 
 logger = logging.getLogger(__name__)
 
 TELEGRAM_LINK_RE = re.compile(r"https?://t\.me/(c/)?([\w_]+)/([0-9]+)")
 
+_MESSAGE_LINK_RE = re.compile(r"https?://t\.me/c/[^\s]+")
+
+# Single type-keyed dispatch instead of probing each peer attribute with
+# getattr(..., None) in turn.
+_PEER_ID_ATTRS = {
+    PeerChannel: "channel_id",
+    PeerChat: "chat_id",
+    PeerUser: "user_id",
+}
+
 
 @dataclass
 class FetchOutcome:
@@ -37,14 +47,15 @@ def message_identity(message: Message) -> tuple[int | None, int]:
     peer = message.peer_id
     if peer is None:
         return (None, message.id)
-    channel_id = getattr(peer, "channel_id", None)
-    if channel_id is not None:
-        return (channel_id, message.id)
-    chat_id = getattr(peer, "chat_id", None)
-    if chat_id is not None:
-        return (chat_id, message.id)
-    user_id = getattr(peer, "user_id", None)
-    return (user_id, message.id)
+    attr = _PEER_ID_ATTRS.get(type(peer))
+    if attr is not None:
+        return (getattr(peer, attr), message.id)
+    # Unknown peer type; fall back to the old attribute probing.
+    for attr in ("channel_id", "chat_id", "user_id"):
+        peer_id = getattr(peer, attr, None)
+        if peer_id is not None:
+            return (peer_id, message.id)
+    return (None, message.id)
 
 
 def message_identity_string(message: Message) -> str:
@@ -54,9 +65,60 @@ def message_identity_string(message: Message) -> str:
     return f"{channel_id}:{message_id}"
 
 
+_INT64_MASK = (1 << 64) - 1
+
+
+def message_identity_key(message: Message) -> int:
+    """Return a packed 64-bit identity key for a Telethon message.
+
+    Packing channel and message id into one signed int64 lets the dedup
+    store use the key directly as its INTEGER PRIMARY KEY, skipping the
+    string formatting and hashing that message_identity_string needs.
+    Message ids are 32-bit, so the low 32 bits are collision-free and
+    only the channel id is folded into the high bits.
+    """
+
+    channel_id, message_id = message_identity(message)
+    packed = (((channel_id or 0) << 32) ^ message_id) & _INT64_MASK
+    if packed >= 1 << 63:
+        packed -= 1 << 64
+    return packed
+
+
+def _parse_link_fast(link: str) -> Optional[Tuple[str | int, int]]:
+    """Parse a well-formed t.me link by slicing, skipping the regex."""
+
+    if link.startswith("https://t.me/"):
+        rest = link[13:]
+    elif link.startswith("http://t.me/"):
+        rest = link[12:]
+    else:
+        return None
+
+    parts = rest.split("/")
+    if parts and parts[0] == "c":
+        # Private channel links: t.me/c/<channel_id>/<message_id>
+        if len(parts) >= 3 and parts[1].isascii() and parts[1].isdigit():
+            msg_part = parts[2]
+            if msg_part.isascii() and msg_part.isdigit():
+                peer = -(int(parts[1]) + 100 * 10 ** len(parts[1]))
+                return peer, int(msg_part)
+        return None
+
+    if len(parts) >= 2 and parts[1].isascii() and parts[1].isdigit():
+        name = parts[0]
+        if name and all(ch.isalnum() or ch == "_" for ch in name):
+            return name, int(parts[1])
+    return None
+
+
 def parse_telegram_link(link: str) -> Optional[Tuple[str | int, int]]:
     """Extract the peer identifier and message id from a Telegram link."""
 
+    parsed = _parse_link_fast(link)
+    if parsed is not None:
+        return parsed
+
     match = TELEGRAM_LINK_RE.search(link)
     if not match:
         return None
@@ -119,8 +181,22 @@ def extract_channel_link_from_entities(message: Message) -> Optional[str]:
 def extract_message_link(text: str) -> Optional[str]:
     """Return the first message link of the form https://t.me/c/..."""
 
-    if not text:
+    # Most messages carry no link at all; a C-level substring check is
+    # far cheaper than starting the regex engine just to find that out.
+    if not text or "t.me/" not in text:
         return None
-    match = re.search(r"https?://t\.me/c/[^\s]+", text)
+    match = _MESSAGE_LINK_RE.search(text)
     return match.group(0) if match else None
 
+
+def extract_message_links(text: str) -> list:
+    """Return all distinct message links in text, in order of appearance.
+
+    A repeated link would otherwise cost a dedup round-trip per
+    occurrence; dict.fromkeys collapses repeats while keeping order.
+    """
+
+    if not text or "t.me/" not in text:
+        return []
+    return list(dict.fromkeys(_MESSAGE_LINK_RE.findall(text)))
+
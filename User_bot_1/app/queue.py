@@ -3,13 +3,17 @@
 
 import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from typing import Iterable, Optional
 
-from app.messages import fetch_message_by_link, message_identity_string
+from app.messages import fetch_message_by_link, message_identity_key
 
 logger = logging.getLogger(__name__)
 
+# Identities remembered in the in-process duplicate cache.
+_RECENT_CACHE_SIZE = 10000
+
 
 class ForwardingQueue:
     """Queue for forwarding messages with rate limiting."""
@@ -20,7 +24,7 @@ class ForwardingQueue:
         subscription_tracker,
         delay_seconds: float = 0.0,
         max_messages_per_second: Optional[float] = None,
-        maxsize: Optional[int] = None,
+        maxsize: Optional[int] = 10000,
     ):
         self.dedup_store = dedup_store
         self.subscription_tracker = subscription_tracker
@@ -29,12 +33,21 @@ class ForwardingQueue:
         self.min_interval = (
             1.0 / max_messages_per_second if max_messages_per_second else 0.0
         )
+        # Bounded by default: an unbounded queue grows without limit when
+        # the source outpaces forwarding and hides the backlog until the
+        # process is swapping.  Pass None to opt out explicitly.
         self.queue: asyncio.Queue = (
             asyncio.Queue(maxsize=maxsize) if maxsize else asyncio.Queue()
         )
         self.running = False
+        self.dropped_count = 0
         self.worker_task: asyncio.Task | None = None
-        self.last_send_time: Optional[datetime] = None
+        self._stop_event = asyncio.Event()
+        # Monotonic loop time of the last send; 0.0 means never sent.
+        self.last_send_time: float = 0.0
+        # LRU of recently seen identity keys; a hit here skips the SQLite
+        # round-trip entirely for hot duplicates.
+        self._recent_identities: OrderedDict[int, None] = OrderedDict()
 
         logger.info(
             "Initialized forwarding queue: delay=%ss, max_mps=%s, maxsize=%s",
@@ -49,14 +62,33 @@ class ForwardingQueue:
         targets: Iterable[str],
         channel_link: str | None = None,
     ):
-        """Add a Telegram link to the forwarding queue."""
-
-        await self.queue.put((client, message_link, list(targets), channel_link))
+        """Add a Telegram link to the forwarding queue.
+
+        Never blocks: when the queue is full the link is dropped with a
+        warning rather than stalling the caller — this runs inside the
+        Telethon event dispatch, and awaiting a full queue there would
+        freeze the whole update pump.
+
+        Returns:
+            True if the link was queued, False if it was dropped
+        """
+
+        try:
+            self.queue.put_nowait((client, message_link, list(targets), channel_link))
+        except asyncio.QueueFull:
+            self.dropped_count += 1
+            logger.warning(
+                "Forwarding queue full; dropped %s (%d dropped so far)",
+                message_link,
+                self.dropped_count,
+            )
+            return False
         logger.info("Queued link %s", message_link)
 
 
         if not self.running:
             await self.start()
+        return True
 
     async def start(self):
         """Start the queue worker."""
@@ -65,6 +97,7 @@ class ForwardingQueue:
             return
 
         self.running = True
+        self._stop_event.clear()
         self.worker_task = asyncio.create_task(self._worker())
         logger.info("Forwarding queue worker started")
 
@@ -72,9 +105,9 @@ class ForwardingQueue:
         """Stop the queue worker."""
 
         self.running = False
+        self._stop_event.set()
 
         if self.worker_task:
-            self.worker_task.cancel()
             try:
                 await self.worker_task
             except asyncio.CancelledError:
@@ -85,84 +118,159 @@ class ForwardingQueue:
     async def _respect_rate_limits(self):
         """Sleep to honour the configured rate limits."""
 
-        now = datetime.now()
+        # loop.time() is monotonic (immune to wall-clock jumps) and a
+        # plain float subtraction, unlike datetime.now() arithmetic.
+        loop = asyncio.get_running_loop()
         if self.last_send_time:
-            elapsed = (now - self.last_send_time).total_seconds()
-            wait_for = max(0.0, self.min_interval - elapsed)
+            elapsed = loop.time() - self.last_send_time
+            wait_for = self.min_interval - elapsed
             if wait_for > 0:
                 await asyncio.sleep(wait_for)
         if self.delay_seconds:
             await asyncio.sleep(self.delay_seconds)
-        self.last_send_time = datetime.now()
+        self.last_send_time = loop.time()
+
+    async def _safe_forward(self, client, target, message, message_link: str) -> bool:
+        """Forward to one target, logging instead of raising on failure."""
+
+        try:
+            await client.forward_messages(target, message)
+            return True
+        except Exception as exc:  # pragma: no cover - network errors
+            logger.error("Failed to forward %s to %s: %s", message_link, target, exc)
+            return False
+
+    def _remember_identity(self, identity: int):
+        """Record an identity key in the in-process duplicate cache."""
+
+        cache = self._recent_identities
+        cache[identity] = None
+        cache.move_to_end(identity)
+        while len(cache) > _RECENT_CACHE_SIZE:
+            cache.popitem(last=False)
 
     async def _forward_message(self, client, message, targets, message_link: str):
-        identity = message_identity_string(message)
-        if self.dedup_store and self.dedup_store.is_duplicate(identity):
-            logger.info("Duplicate message %s, skipping", identity)
+        # The packed int key skips the format-then-hash work of the
+        # string identity and is stored in the dedup tables verbatim.
+        identity = message_identity_key(message)
+        if identity in self._recent_identities:
+            self._recent_identities.move_to_end(identity)
+            logger.info("Duplicate message %s, skipping", message_link)
+            return
+        # Keep SQLite off the event loop; see the handler in run.py.
+        if self.dedup_store and await asyncio.to_thread(
+            self.dedup_store.is_duplicate_key, identity
+        ):
+            self._remember_identity(identity)
+            logger.info("Duplicate message %s, skipping", message_link)
             return
 
-        forward_success = False
-        for target in targets:
-            try:
-                await self._respect_rate_limits()
-                await client.forward_messages(target, message)
-                logger.info("Forwarded %s to %s", identity, target)
-                forward_success = True
-            except Exception as exc:  # pragma: no cover - network errors
-                logger.error("Failed to forward %s to %s: %s", identity, target, exc)
-
-        if forward_success and self.dedup_store:
-            self.dedup_store.add_message(identity)
-            self.dedup_store.add_message(message_link)
+        # One rate-limit tick per message, then fan out to all targets
+        # concurrently instead of serialising a sleep per target.
+        await self._respect_rate_limits()
+        results = await asyncio.gather(
+            *(
+                self._safe_forward(client, target, message, message_link)
+                for target in targets
+            )
+        )
+        # One summary record per message instead of one per target;
+        # failures are still logged individually in _safe_forward.
+        ok_targets = [target for target, ok in zip(targets, results) if ok]
+        if ok_targets:
+            logger.info(
+                "Forwarded %s to %d target(s): %s",
+                message_link,
+                len(ok_targets),
+                ", ".join(ok_targets),
+            )
+        forward_success = bool(ok_targets)
+
+        if forward_success:
+            self._remember_identity(identity)
+            if self.dedup_store:
+                # The link itself was already recorded by check_and_add
+                # when the handler enqueued it; only the message identity
+                # still needs to be stored here.
+                await asyncio.to_thread(self.dedup_store.add_key, identity)
+        elif self.dedup_store:
+            # Every target refused the message; drop the link key so a
+            # repost is not silently swallowed for the retention window.
+            await asyncio.to_thread(self.dedup_store.delete_message, message_link)
 
 
     async def _worker(self):
         """Worker that processes the forwarding queue."""
 
-        while self.running:
-            try:
-                client, message_link, targets, channel_link = await asyncio.wait_for(
-                    self.queue.get(), timeout=1.0
-                )
-
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
-            try:
-                outcome = await fetch_message_by_link(client, message_link)
-                if outcome.message is None:
-                    if outcome.needs_join and channel_link:
-                        status = await self.subscription_tracker.ensure_membership(
-                            client, channel_link, message_link
+        # Sleep on the queue and a stop event instead of polling with a
+        # one-second timeout; an idle worker no longer wakes at all.
+        stop_task = asyncio.create_task(self._stop_event.wait())
+        try:
+            while not self._stop_event.is_set():
+                get_task = asyncio.create_task(self.queue.get())
+                try:
+                    done, _ = await asyncio.wait(
+                        {get_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                except asyncio.CancelledError:
+                    get_task.cancel()
+                    break
+                if get_task not in done:
+                    get_task.cancel()
+                    break
+                client, message_link, targets, channel_link = get_task.result()
+                await self._process_item(client, message_link, targets, channel_link)
+        finally:
+            stop_task.cancel()
+
+    async def _process_item(self, client, message_link, targets, channel_link):
+        """Handle a single dequeued link."""
+
+        try:
+            outcome = await fetch_message_by_link(client, message_link)
+            if outcome.message is None:
+                if outcome.needs_join and channel_link:
+                    status = await self.subscription_tracker.ensure_membership(
+                        client, channel_link, message_link
+                    )
+                    if status == "waiting_approval":
+                        logger.info(
+                            "Waiting for channel access to fetch %s; will retry later",
+                            message_link,
+                        )
+                    elif status == "limit_exceeded":
+                        logger.warning(
+                            "Join limit reached; stored pending task for %s", message_link
                         )
-                        if status == "waiting_approval":
-                            logger.info(
-                                "Waiting for channel access to fetch %s; will retry later",
-                                message_link,
-                            )
-                        elif status == "limit_exceeded":
-                            logger.warning(
-                                "Join limit reached; stored pending task for %s", message_link
-                            )
-                        else:
-                            logger.warning(
-                                "Join attempt for %s ended with status %s",
-                                message_link,
-                                status,
-                            )
                     else:
-                        logger.warning("Message not available for link %s", message_link)
-                    continue
-
-
-                await self._forward_message(client, outcome.message, targets, message_link)
-            except asyncio.CancelledError:
-                break
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.error("Error in forwarding worker: %s", exc)
-            finally:
-                self.queue.task_done()
+                        logger.warning(
+                            "Join attempt for %s ended with status %s",
+                            message_link,
+                            status,
+                        )
+                else:
+                    logger.warning("Message not available for link %s", message_link)
+                    # The link was committed at enqueue time; un-record
+                    # it so a repost can retry this transient failure
+                    # (the join branches park it in pending_forwards
+                    # instead).
+                    if self.dedup_store:
+                        await asyncio.to_thread(
+                            self.dedup_store.delete_message, message_link
+                        )
+                return
+
+            await self._forward_message(client, outcome.message, targets, message_link)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.error("Error in forwarding worker: %s", exc)
+            if self.dedup_store:
+                await asyncio.to_thread(
+                    self.dedup_store.delete_message, message_link
+                )
+        finally:
+            self.queue.task_done()
 
     def get_queue_size(self) -> int:
         """Get current queue size."""
@@ -209,54 +317,73 @@ class PendingForwardWorker:
         logger.info("Pending forward worker stopped")
 
     async def _worker(self):
+        # Rows in a sweep are independent; retry a handful of them
+        # concurrently instead of awaiting each fetch in turn.  The
+        # semaphore keeps the burst polite towards Telegram.
+        semaphore = asyncio.Semaphore(8)
         while self.running:
             try:
                 await asyncio.sleep(self.retry_interval_seconds)
-                pending_rows = self.dedup_store.get_pending_forwards_for_retry(
-                    limit=25, max_attempts=self.max_attempts
+                pending_rows = await asyncio.to_thread(
+                    self.dedup_store.get_pending_forwards_for_retry,
+                    limit=25,
+                    max_attempts=self.max_attempts,
                 )
                 if not pending_rows:
                     continue
 
-                for row in pending_rows:
-                    try:
-                        outcome = await fetch_message_by_link(
-                            self.client, row["message_link"]
-                        )
-                        attempts = int(row["attempts"]) + 1
-                        now = datetime.now()
-                        if outcome.message:
-                            await self.queue._forward_message(
-                                self.client, outcome.message, self.targets, row["message_link"]
-                            )
-                            await self.subscription_tracker.leave_after_forward(
-                                self.client, row["channel_link"]
-                            )
-                            self.dedup_store.update_pending_forward_status(
-                                row["id"], "done", attempts, now
-                            )
-                            continue
-
-                        if outcome.needs_join:
-                            status = "waiting_approval"
-                        else:
-                            status = "join_failed"
-                        if attempts >= self.max_attempts and status == "waiting_approval":
-                            status = "join_failed"
-
-                        self.dedup_store.update_pending_forward_status(
-                            row["id"], status, attempts, now, str(outcome.access_error)
-                        )
-                    except Exception as exc:  # pragma: no cover - defensive
-                        logger.error("Error retrying pending forward %s: %s", row["id"], exc)
-                        try:
-                            self.dedup_store.update_pending_forward_status(
-                                row["id"], "join_failed", row["attempts"] + 1, datetime.now(), str(exc)
-                            )
-                        except Exception:
-                            logger.debug("Failed to update pending status for %s", row["id"])
+                # One UPDATE per row meant one commit (and fsync) per
+                # row; collect the outcomes and flush them in a single
+                # transaction at the end of the sweep.
+                status_updates = await asyncio.gather(
+                    *(self._process_row(row, semaphore) for row in pending_rows)
+                )
+                if status_updates:
+                    await asyncio.to_thread(
+                        self.dedup_store.update_pending_forward_statuses_bulk,
+                        status_updates,
+                    )
             except asyncio.CancelledError:
                 break
             except Exception as exc:  # pragma: no cover - defensive
                 logger.error("Error in pending forward worker: %s", exc)
 
+    async def _process_row(self, row, semaphore: asyncio.Semaphore) -> tuple:
+        """Retry one pending forward and return its status-update row."""
+
+        async with semaphore:
+            try:
+                outcome = await fetch_message_by_link(
+                    self.client, row["message_link"]
+                )
+                attempts = int(row["attempts"]) + 1
+                now = datetime.now()
+                if outcome.message:
+                    await self.queue._forward_message(
+                        self.client, outcome.message, self.targets, row["message_link"]
+                    )
+                    await self.subscription_tracker.leave_after_forward(
+                        self.client, row["channel_link"]
+                    )
+                    return ("done", attempts, now, None, row["id"])
+
+                if outcome.needs_join:
+                    status = "waiting_approval"
+                else:
+                    status = "join_failed"
+                if attempts >= self.max_attempts and status == "waiting_approval":
+                    status = "join_failed"
+
+                return (status, attempts, now, str(outcome.access_error), row["id"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.error("Error retrying pending forward %s: %s", row["id"], exc)
+                return (
+                    "join_failed",
+                    row["attempts"] + 1,
+                    datetime.now(),
+                    str(exc),
+                    row["id"],
+                )
+
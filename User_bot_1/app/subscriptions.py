@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 
@@ -9,6 +10,7 @@ from telethon import functions
 from telethon.errors.rpcerrorlist import (
     ChannelPrivateError,
     ChannelsTooMuchError,
+    FloodWaitError,
 )
 
 
@@ -16,6 +18,9 @@ from app.dedup import DeduplicationStore
 
 logger = logging.getLogger(__name__)
 
+# Resolved input entities kept per tracker.
+_ENTITY_CACHE_SIZE = 1024
+
 
 class SubscriptionTracker:
     """Track channels we requested to join to fetch pending messages."""
@@ -23,8 +28,30 @@ class SubscriptionTracker:
     def __init__(self, store: DeduplicationStore, max_joins: int = 450):
         self.store = store
         self.max_joins = max_joins
+        # Telethon caches entities too, but going through it still costs
+        # a lock and session lookup per call; a plain dict answers repeat
+        # links for the same channel immediately.
+        self._entity_cache: dict = {}
+
+    async def _db(self, fn, *args):
+        """Run a synchronous store call without blocking the event loop."""
+
+        return await asyncio.to_thread(fn, *args)
+
+    async def _resolve_input_entity(self, client, peer):
+        """Resolve an input entity, reusing previously resolved peers."""
+
+        cached = self._entity_cache.get(peer)
+        if cached is not None:
+            return cached
+        entity = await client.get_input_entity(peer)
+        self._entity_cache[peer] = entity
+        while len(self._entity_cache) > _ENTITY_CACHE_SIZE:
+            self._entity_cache.pop(next(iter(self._entity_cache)))
+        return entity
 
     async def leave_channel(self, client, peer) -> None:
+        self._entity_cache.pop(peer, None)
         try:
             await client(functions.channels.LeaveChannelRequest(peer))
             logger.info("Left channel %s to stay under join limits", peer)
@@ -34,26 +61,28 @@ class SubscriptionTracker:
         try:
             await self.leave_channel(client, channel_link)
         finally:
-            self.store.remove_joined_channel(channel_link)
+            self._entity_cache.pop(channel_link, None)
+            await self._db(self.store.remove_joined_channel, channel_link)
 
     async def ensure_membership(
         self, client, channel_link: str, message_link: str
     ) -> str:
         """Attempt to join a channel and return the resulting status string."""
 
-        if self.store.count_joined_channels() >= self.max_joins:
-            oldest = self.store.get_oldest_joined_channel()
+        if await self._db(self.store.count_joined_channels) >= self.max_joins:
+            oldest = await self._db(self.store.get_oldest_joined_channel)
             if oldest:
                 await self.leave_channel(client, oldest["channel_link"])
-                self.store.remove_joined_channel(oldest["channel_link"])
-            if self.store.count_joined_channels() >= self.max_joins:
-                self.store.add_pending_forward(
-                    message_link, channel_link, "limit_exceeded", "join limit reached"
+                await self._db(self.store.remove_joined_channel, oldest["channel_link"])
+            if await self._db(self.store.count_joined_channels) >= self.max_joins:
+                await self._db(
+                    self.store.add_pending_forward,
+                    message_link, channel_link, "limit_exceeded", "join limit reached",
                 )
                 return "limit_exceeded"
 
         try:
-            input_entity = await client.get_input_entity(channel_link)
+            input_entity = await self._resolve_input_entity(client, channel_link)
             channel_id = getattr(input_entity, "channel_id", None)
         except Exception:
             channel_id = None
@@ -61,19 +90,39 @@ class SubscriptionTracker:
         try:
 
             await client(functions.channels.JoinChannelRequest(channel_link))
-            self.store.record_joined_channel(channel_link, channel_id)
-            self.store.add_pending_forward(
-                message_link, channel_link, "waiting_approval"
+            await self._db(self.store.record_joined_channel, channel_link, channel_id)
+            await self._db(
+                self.store.add_pending_forward,
+                message_link, channel_link, "waiting_approval",
             )
             return "waiting_approval"
         except ChannelsTooMuchError:
-            self.store.add_pending_forward(
-                message_link, channel_link, "limit_exceeded", "too many channels"
+            await self._db(
+                self.store.add_pending_forward,
+                message_link, channel_link, "limit_exceeded", "too many channels",
             )
             logger.warning("Cannot join %s: reached subscription limit", channel_link)
             return "limit_exceeded"
+        except FloodWaitError as exc:
+            # Do not sleep out the flood wait on the worker; park the
+            # link as pending and let the retry worker pick it up after
+            # its regular interval, by which time the wait has passed.
+            await self._db(
+                self.store.add_pending_forward,
+                message_link,
+                channel_link,
+                "waiting_approval",
+                f"flood wait {exc.seconds}s",
+            )
+            logger.warning(
+                "Flood wait of %ss joining %s; deferred to retry worker",
+                exc.seconds,
+                channel_link,
+            )
+            return "waiting_approval"
         except ChannelPrivateError as exc:
-            self.store.add_pending_forward(
+            await self._db(
+                self.store.add_pending_forward,
                 message_link,
                 channel_link,
                 "waiting_approval",
@@ -82,8 +131,9 @@ class SubscriptionTracker:
             return "waiting_approval"
         except Exception as exc:  # pragma: no cover - defensive
             logger.error("Failed to join %s: %s", channel_link, exc)
-            self.store.add_pending_forward(
-                message_link, channel_link, "join_failed", str(exc)
+            await self._db(
+                self.store.add_pending_forward,
+                message_link, channel_link, "join_failed", str(exc),
             )
             return "join_failed"
 
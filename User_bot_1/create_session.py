@@ -1,10 +1,11 @@
 
 """Create and print a Telegram StringSession for the bot."""
+import asyncio
 import os
 from pathlib import Path
 
+from telethon import TelegramClient
 from telethon.sessions import StringSession
-from telethon.sync import TelegramClient
 
 API_ID = int(os.getenv("TELEGRAM_API_ID", os.getenv("API_ID", "0")))
 API_HASH = os.getenv("TELEGRAM_API_HASH", os.getenv("API_HASH", ""))
@@ -12,6 +13,17 @@ API_HASH = os.getenv("TELEGRAM_API_HASH", os.getenv("API_HASH", ""))
 DATA_DIR = Path(os.getenv("DATA_DIR", "data"))
 
 
+async def _run() -> tuple:
+    """Log in interactively and return (me, session_string)."""
+
+    client = TelegramClient(StringSession(), API_ID, API_HASH)
+    await client.start()
+    me = await client.get_me()
+    session_string = client.session.save()
+    await client.disconnect()
+    return me, session_string
+
+
 def main() -> None:
     """Interactively log in and print the StringSession value."""
 
@@ -25,13 +37,8 @@ def main() -> None:
     print("Creating Telegram StringSession...")
 
     print(f"API_ID: {API_ID}")
-    print(f"API_HASH: {API_HASH}")
-    print(f"Session file: {session_file}")
 
-    with TelegramClient(StringSession(), API_ID, API_HASH) as client:
-        client.start()
-        me = client.get_me()
-        session_string = client.session.save()
+    me, session_string = asyncio.run(_run())
 
     print(f"\n✅ Successfully logged in as: {me.first_name} (@{me.username})")
     print("🔑 TELEGRAM_STRING_SESSION (add to your .env):")
@@ -1,6 +1,7 @@
 """Main entry point for the Telegram forwarder bot."""
 import asyncio
 import logging
+import re
 
 import signal
 import sys
@@ -8,10 +9,10 @@ import sys
 from telethon import TelegramClient, events
 from telethon.sessions import StringSession
 
-from app.config import Settings
+from app.config import load_settings
 from app.dedup import DeduplicationStore
 
-from app.messages import extract_channel_link_from_entities, extract_message_link
+from app.messages import extract_channel_link_from_entities, extract_message_links
 from app.queue import ForwardingQueue, PendingForwardWorker
 
 from app.subscriptions import SubscriptionTracker
@@ -26,26 +27,47 @@ logger = logging.getLogger(__name__)
 
 shutdown_event = asyncio.Event()
 
+# Compiled once at import; per-message re.search with a string literal
+# would re-hash the pattern into re's cache on every event.
+_TME_LINK_RE = re.compile(r"https?://t\.me/[^\s]+")
 
-def signal_handler(signum, frame):
+
+def signal_handler(signum, frame=None):
     """Handle shutdown signals."""
 
     logger.info("Received signal %s, initiating graceful shutdown...", signum)
     shutdown_event.set()
 
+
+def install_signal_handlers(loop: asyncio.AbstractEventLoop) -> None:
+    """Route SIGINT/SIGTERM through the event loop.
+
+    loop.add_signal_handler runs the callback on the loop itself, so
+    setting the (not thread-safe) shutdown event needs no cross-thread
+    wakeup; signal.signal remains as the fallback on platforms without
+    loop signal support (Windows).
+    """
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, signal_handler, sig)
+        except NotImplementedError:
+            signal.signal(sig, signal_handler)
+
 def extract_first_link(text: str) -> str | None:
     """Return the first Telegram link from the given text."""
 
-    if not text:
+    # Cheap substring check first: link-less messages are the common
+    # case and skip the regex engine entirely.
+    if not text or "t.me/" not in text:
         return None
-    match = re.search(r"https?://t\.me/[^\s]+", text)
+    match = _TME_LINK_RE.search(text)
     return match.group(0) if match else None
 
 async def main():
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    install_signal_handlers(asyncio.get_running_loop())
 
-    settings = Settings()
+    settings = load_settings()
     logging.getLogger().setLevel(settings.log_level.upper())
 
     settings.data_dir.mkdir(parents=True, exist_ok=True)
@@ -94,30 +116,68 @@ async def main():
     pending_worker.client = client
 
 
+    # Tasks spawned per message so the handler returns immediately;
+    # gathered on shutdown so no dedup write or enqueue is lost.
+    inflight_tasks: set = set()
+
+    async def process_link(message_link: str, channel_link: str | None):
+        if settings.forwarding_enabled:
+            # Single fused check+insert instead of is_duplicate followed by
+            # add_message; the link is marked at enqueue time so bursts of
+            # the same link cannot race past the check.
+            # DB work runs in a thread so the event loop keeps servicing
+            # updates and network I/O while SQLite touches disk.
+            if dedup_store and not await asyncio.to_thread(
+                dedup_store.check_and_add, message_link
+            ):
+                logger.info("Link %s already processed, skipping", message_link)
+                return
+            queued = await queue.add_link(
+                client, message_link, settings.target_channels, channel_link=channel_link
+            )
+            if not queued and dedup_store:
+                # check_and_add already committed the link; un-record it
+                # so a repost can get through once the queue drains.
+                await asyncio.to_thread(dedup_store.delete_message, message_link)
+        else:
+            if dedup_store and await asyncio.to_thread(
+                dedup_store.is_duplicate, message_link
+            ):
+                logger.info("Link %s already processed, skipping", message_link)
+                return
+            logger.info("Dry run: would forward %s", message_link)
+
+    async def process_links(message_links, channel_link: str | None):
+        # Multi-link messages: one batched IN (...) probe weeds out the
+        # already-seen links before the per-link check_and_add runs.
+        if dedup_store and len(message_links) > 1:
+            message_links = await asyncio.to_thread(
+                dedup_store.filter_new, message_links
+            )
+        for message_link in message_links:
+            await process_link(message_link, channel_link)
+
     @client.on(events.NewMessage(chats=settings.source_channel))
     async def handler(event):
-        if shutdown_event.is_set():
-            return
-
         message_text = event.message.message or ""
-        message_link = extract_message_link(message_text)
+        message_links = extract_message_links(message_text)
         channel_link = extract_channel_link_from_entities(event.message)
 
-        if not message_link:
-            logger.debug("No link found in message %s", event.message.id)
+        if not message_links:
+            # This branch runs for every link-less message; skip even the
+            # record/handler dispatch when DEBUG is off (the default).
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No link found in message %s", event.message.id)
             return
 
-        if dedup_store and dedup_store.is_duplicate(message_link):
-            logger.info("Link %s already processed, skipping", message_link)
-            return
+        # Telethon dispatches updates one handler at a time; doing the
+        # dedup checks and enqueues in a task keeps the update pump free.
+        task = asyncio.create_task(process_links(message_links, channel_link))
+        inflight_tasks.add(task)
+        task.add_done_callback(inflight_tasks.discard)
 
-        if settings.forwarding_enabled:
-            await queue.add_link(
-                client, message_link, settings.target_channels, channel_link=channel_link
-            )
-        else:
-            logger.info("Dry run: would forward %s", message_link)
 
+    cleanup_task = asyncio.create_task(dedup_store.run_cleanup_loop())
 
     try:
         await client.start()
@@ -128,10 +188,18 @@ async def main():
 
         await shutdown_event.wait()
 
+        # Unbind the handler so Telethon stops routing updates at all,
+        # rather than paying a shutdown check on every event while the
+        # process winds down.
+        client.remove_event_handler(handler)
+
     except Exception as exc:  # pragma: no cover - defensive
         logger.exception("Error in main loop: %s", exc)
     finally:
         logger.info("Shutting down...")
+        cleanup_task.cancel()
+        if inflight_tasks:
+            await asyncio.gather(*inflight_tasks, return_exceptions=True)
         await pending_worker.stop()
         await queue.stop()
         if dedup_store: